@@ -4,434 +4,170 @@ Generate HTML report matching the original dark theme design
 Maintains the beautiful dark aesthetic with modern styling
 """
 
+import functools
+import gc
+import gzip
+import hashlib
 import json
 import os
-from datetime import datetime, timedelta, timezone
+import string
+import sys
+from datetime import datetime, timedelta
+
+try:
+    import orjson  # optional: native JSON parser, stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson else json.loads
+
+try:
+    import brotli  # optional: adds a precompressed index.html.br next to the gzip copy
+except ImportError:
+    brotli = None
+
+if sys.version_info >= (3, 11):
+    parse_iso = datetime.fromisoformat  # accepts a trailing 'Z' natively
+else:
+    def parse_iso(iso_str):
+        """Parse an ISO-8601 timestamp, accepting a trailing 'Z' for UTC"""
+        if iso_str.endswith('Z'):
+            iso_str = iso_str[:-1] + '+00:00'
+        return datetime.fromisoformat(iso_str)
+
+# Dutch day and month names, indexed by date.weekday() and date.month - 1
+DUTCH_DAY_NAMES = ('maandag', 'dinsdag', 'woensdag', 'donderdag', 'vrijdag', 'zaterdag', 'zondag')
+DUTCH_SHORT_DAY_NAMES = ('Ma', 'Di', 'Wo', 'Do', 'Vr', 'Za', 'Zo')
+DUTCH_MONTH_NAMES = ('januari', 'februari', 'maart', 'april', 'mei', 'juni', 'juli',
+                     'augustus', 'september', 'oktober', 'november', 'december')
+
+BEST_HOUR_ROW_CLASS = ' class="best-single-hour"'
+
+# One price table row: row class, hour block, €/MWh, ct/kWh, bar width (%)
+PRICE_ROW_TEMPLATE = (
+    '<tr%s><td data-label="Uurblok">%s</td>'
+    '<td data-label="Prijs (€/MWh)">%.2f €</td>'
+    '<td data-label="Prijs (ct/kWh)">%.2f ct/kWh</td>'
+    '<td data-label="Niveau" class="bar-cell"><div class="bar-wrapper">'
+    '<div class="bar" style="width: %.1f%%"></div></div></td></tr>\n'
+)
+
+@functools.lru_cache(maxsize=4096)
+def format_time_hhmm(iso_str):
+    """Format an ISO timestamp string as HH:MM (cached per timestamp)"""
+    dt = parse_iso(iso_str)
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+def parse_time_safe(time_obj):
+    """Safely parse datetime object or ISO string to HH:MM format"""
+    if hasattr(time_obj, 'strftime'):
+        return f"{time_obj.hour:02d}:{time_obj.minute:02d}"
+    return format_time_hhmm(time_obj)
 
 def format_cheapest_blocks_html(cheapest_blocks):
     """Format cheapest consecutive blocks for HTML display"""
     if not cheapest_blocks:
         return "<p>Geen blokgegevens beschikbaar</p>"
     
-    def parse_time_safe(time_obj):
-        """Safely parse datetime object or ISO string to HH:MM format"""
-        if hasattr(time_obj, 'strftime'):
-            return time_obj.strftime('%H:%M')
-        else:
-            return datetime.fromisoformat(time_obj.replace('Z', '+00:00')).strftime('%H:%M')
-    
-    html = ""
+    parts = []
     
     # 1 hour block (quickest appliances)
     if cheapest_blocks.get('1_hour'):
         block_1h = cheapest_blocks['1_hour']
         time_1h = parse_time_safe(block_1h['time'])
-        html += f'<p><strong>🔌 Korte toestellen (1u):</strong> {time_1h} - €{block_1h["price"]:.2f}/MWh</p>'
+        parts.append(f'<p><strong>🔌 Korte toestellen (1u):</strong> {time_1h} - €{block_1h["price"]:.2f}/MWh</p>')
     
     # 2 hour block (washing machines)
     if cheapest_blocks.get('2_hours'):
         block_2h = cheapest_blocks['2_hours']
         start_2h = parse_time_safe(block_2h['start_time'])
         end_2h = parse_time_safe(block_2h['end_time'])
-        html += f'<p><strong>🧺 Wasmachine (2u):</strong> {start_2h}-{end_2h} - €{block_2h["average_price"]:.2f}/MWh</p>'
+        parts.append(f'<p><strong>🧺 Wasmachine (2u):</strong> {start_2h}-{end_2h} - €{block_2h["average_price"]:.2f}/MWh</p>')
     
     # 3 hour block (dishwashers, longer cycles)
     if cheapest_blocks.get('3_hours'):
         block_3h = cheapest_blocks['3_hours']
         start_3h = parse_time_safe(block_3h['start_time'])
         end_3h = parse_time_safe(block_3h['end_time'])
-        html += f'<p><strong>🍽️ Vaatwas (3u):</strong> {start_3h}-{end_3h} - €{block_3h["average_price"]:.2f}/MWh</p>'
+        parts.append(f'<p><strong>🍽️ Vaatwas (3u):</strong> {start_3h}-{end_3h} - €{block_3h["average_price"]:.2f}/MWh</p>')
     
     # 4 hour block (dryers, long cycles)
     if cheapest_blocks.get('4_hours'):
         block_4h = cheapest_blocks['4_hours']
         start_4h = parse_time_safe(block_4h['start_time'])
         end_4h = parse_time_safe(block_4h['end_time'])
-        html += f'<p><strong>👕 Droogkast (4u):</strong> {start_4h}-{end_4h} - €{block_4h["average_price"]:.2f}/MWh</p>'
+        parts.append(f'<p><strong>👕 Droogkast (4u):</strong> {start_4h}-{end_4h} - €{block_4h["average_price"]:.2f}/MWh</p>')
     
-    if html:
-        html += '<p class="note">💡 Plan je apparaten om te starten aan het begin van deze tijdsblokken</p>'
+    if parts:
+        parts.append('<p class="note">💡 Plan je apparaten om te starten aan het begin van deze tijdsblokken</p>')
     
-    return html
+    return ''.join(parts)
+
+@functools.lru_cache(maxsize=4096)
+def format_hour_range(iso_str):
+    """Format an ISO timestamp as an 'HH.MMu – HH.MMu' hour block label (cached per timestamp)"""
+    dt = parse_iso(iso_str)
+    end = dt + timedelta(hours=1)
+    return f"{dt.hour:02d}.{dt.minute:02d}u – {end.hour:02d}.{end.minute:02d}u"
+
+@functools.lru_cache(maxsize=64)
+def format_date_dutch(date_str):
+    """Format an ISO date as e.g. 'maandag 08 december 2025'; unparseable input is returned as-is"""
+    if not date_str or not date_str[:4].isdigit():
+        return date_str
+    try:
+        date_obj = datetime.fromisoformat(date_str)
+    except (ValueError, TypeError):
+        return date_str
+    return (f"{DUTCH_DAY_NAMES[date_obj.weekday()]} {date_obj.day:02d} "
+            f"{DUTCH_MONTH_NAMES[date_obj.month - 1]} {date_obj.year}")
+
+def format_retrieved_at(iso_str):
+    """Format an ISO timestamp as 'DD/MM/YYYY om HH:MM', or 'Onbekend' if it can't be read"""
+    try:
+        dt = datetime.fromisoformat(iso_str)
+        return f"{dt.day:02d}/{dt.month:02d}/{dt.year} om {dt.hour:02d}:{dt.minute:02d}"
+    except (ValueError, TypeError):
+        return 'Onbekend'
+
+def format_price_table(prices, min_price=None, max_price=None):
+    """Generate table with price data and highlight cheapest consecutive blocks
 
-def format_price_table(prices):
-    """Generate table with price data and highlight cheapest consecutive blocks"""
+    min_price/max_price can be passed from the day's statistics to skip rescanning the prices.
+    """
     if not prices:
         return '<tbody><tr><td colspan="4">Geen prijsdata beschikbaar</td></tr></tbody>'
     
-    # Find min/max for relative bars
-    price_values = [p['price_eur_mwh'] for p in prices]
-    min_price = min(price_values)
-    max_price = max(price_values)
+    # Pull the columns the table needs out of the price dicts once
+    rows = [(p['datetime'], p['price_eur_mwh'], p['price_cent_kwh']) for p in prices]
     
-    html = '<tbody>'
+    # Find min/max for relative bars in a single pass when the statistics don't provide them
+    if min_price is None or max_price is None:
+        min_price = max_price = rows[0][1]
+        for _, value, _ in rows:
+            if value < min_price:
+                min_price = value
+            elif value > max_price:
+                max_price = value
+
+    # Bar width is a percentage of the day's maximum; multiply by a hoisted reciprocal
+    bar_scale = 100.0 / max_price if max_price > 0 else 0.0
+
+    parts = ['<tbody>']
     
-    for i, price in enumerate(prices):
-        # Parse datetime for display
-        dt = datetime.fromisoformat(price['datetime'].replace('Z', '+00:00'))
-        time_str = dt.strftime('%H.%Mu')
-        next_hour = (dt + timedelta(hours=1)).strftime('%H.%Mu')
-        time_range = f"{time_str} – {next_hour}"
+    for iso_str, value, cent_kwh in rows:
+        time_range = format_hour_range(iso_str)
         
-        # Highlight different blocks
-        row_class = ""
-        if price['price_eur_mwh'] == min_price:
-            row_class = ' class="best-single-hour"'
+        # Highlight the cheapest hour
+        row_class = BEST_HOUR_ROW_CLASS if value == min_price else ''
         
         # Calculate relative bar width
-        ratio = (price['price_eur_mwh'] / max_price) * 100 if max_price > 0 else 0
+        ratio = value * bar_scale
         
-        html += f'''
-            <tr{row_class}>
-                <td data-label="Uurblok">{time_range}</td>
-                <td data-label="Prijs (€/MWh)">{price['price_eur_mwh']:.2f} €</td>
-                <td data-label="Prijs (ct/kWh)">{price['price_cent_kwh']:.2f} ct/kWh</td>
-                <td data-label="Niveau" class="bar-cell">
-                    <div class="bar-wrapper">
-                        <div class="bar" style="width: {ratio:.1f}%"></div>
-                    </div>
-                </td>
-            </tr>
-        '''
-    
-    html += '</tbody>'
-    return html
-
-def generate_html_report(data):
-    """Generate HTML report matching original dark theme"""
-    if not data:
-        return generate_error_page()
+        parts.append(PRICE_ROW_TEMPLATE % (row_class, time_range, value, cent_kwh, ratio))
     
-    metadata = data.get('metadata', {})
-    prices = data.get('prices', [])
-    
-    # Parse date for display
-    try:
-        date_obj = datetime.fromisoformat(metadata.get('date', ''))
-        date_display = date_obj.strftime('%A %d %B %Y')
-        # Dutch day names
-        date_dutch = {
-            'Monday': 'maandag', 'Tuesday': 'dinsdag', 'Wednesday': 'woensdag',
-            'Thursday': 'donderdag', 'Friday': 'vrijdag', 'Saturday': 'zaterdag', 'Sunday': 'zondag',
-            'January': 'januari', 'February': 'februari', 'March': 'maart', 'April': 'april',
-            'May': 'mei', 'June': 'juni', 'July': 'juli', 'August': 'augustus',
-            'September': 'september', 'October': 'oktober', 'November': 'november', 'December': 'december'
-        }
-        for en, nl in date_dutch.items():
-            date_display = date_display.replace(en, nl)
-    except:
-        date_display = metadata.get('date', 'Onbekend')
-    
-    # Statistics
-    stats = metadata.get('statistics', {})
-    avg_price = stats.get('average_eur_mwh', 0)
-    min_price = stats.get('min_eur_mwh', 0)
-    max_price = stats.get('max_eur_mwh', 0)
-    min_hour = stats.get('min_hour', 0)
-    max_hour = stats.get('max_hour', 0)
-    
-    # Retrieved timestamp
-    retrieved_at = metadata.get('retrieved_at', '')
-    try:
-        retrieved_dt = datetime.fromisoformat(retrieved_at)
-        retrieved_display = retrieved_dt.strftime('%d/%m/%Y om %H:%M')
-    except:
-        retrieved_display = 'Onbekend'
-    
-    html = f'''<!DOCTYPE html>
-<html lang="nl">
-<head>
-  <meta charset="UTF-8">
-  <title>Belgian Day-Ahead Electricity Prices</title>
-  <meta name="viewport" content="width=device-width, initial-scale=1">
-  <style>
-    :root {{
-      font-family: system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
-      color-scheme: light dark;
-    }}
-
-    body {{
-      margin: 0;
-      padding: 1.5rem;
-      background: #0f172a;
-      color: #e5e7eb;
-    }}
-
-    h1 {{
-      margin-top: 0;
-      font-size: 1.6rem;
-    }}
-
-    .card {{
-      max-width: 1000px;
-      margin: 0 auto;
-      background: rgba(15, 23, 42, 0.9);
-      border-radius: 1rem;
-      padding: 1.5rem;
-      box-shadow: 0 20px 40px rgba(0, 0, 0, 0.35);
-      border: 1px solid rgba(148, 163, 184, 0.5);
-    }}
-
-    .results {{
-      margin-top: 1.5rem;
-      display: grid;
-      grid-template-columns: minmax(0, 2fr) minmax(0, 3fr);
-      gap: 1.5rem;
-    }}
-
-    @media (max-width: 800px) {{
-      .results {{
-        grid-template-columns: 1fr;
-      }}
-    }}
-
-    .summary {{
-      border-radius: 1rem;
-      padding: 1rem;
-      background: radial-gradient(circle at top left, rgba(34, 197, 94, 0.3), rgba(15, 23, 42, 0.9));
-      border: 1px solid rgba(34, 197, 94, 0.5);
-      min-height: 110px;
-    }}
-
-    .summary h2 {{
-      margin-top: 0;
-      font-size: 1.1rem;
-    }}
-
-    .summary p {{
-      margin: 0.15rem 0;
-      font-size: 0.9rem;
-    }}
-
-    .summary strong {{
-      color: #bbf7d0;
-    }}
-
-    table {{
-      width: 100%;
-      border-collapse: collapse;
-      font-size: 0.85rem;
-      overflow: hidden;
-      border-radius: 1rem;
-    }}
-
-    thead {{
-      background: #020617;
-    }}
-
-    th, td {{
-      padding: 0.4rem 0.5rem;
-      text-align: right;
-      border-bottom: 1px solid #1f2937;
-      white-space: nowrap;
-    }}
-
-    th:first-child, td:first-child {{
-      text-align: left;
-    }}
-
-    tbody tr:nth-child(even) {{
-      background: rgba(15, 23, 42, 0.7);
-    }}
-
-    .best-single-hour {{
-      background: rgba(34, 197, 94, 0.12) !important;
-      position: relative;
-    }}
-
-    .best-single-hour::before {{
-      content: "★";
-      position: absolute;
-      left: 4px;
-      top: 50%;
-      transform: translateY(-50%);
-      font-size: 0.7rem;
-      color: #22c55e;
-    }}
-
-    .bar-cell {{
-      width: 35%;
-    }}
-
-    .bar-wrapper {{
-      height: 8px;
-      border-radius: 999px;
-      background: rgba(31, 41, 55, 0.9);
-      overflow: hidden;
-    }}
-
-    .bar {{
-      height: 100%;
-      border-radius: inherit;
-      background: linear-gradient(90deg, #22c55e, #fbbf24, #f97316, #ef4444);
-      width: 0%;
-      transition: width 0.3s ease;
-    }}
-
-    /* Mobile responsive table */
-    @media (max-width: 600px) {{
-      table, thead, tbody, th, td, tr {{
-        display: block;
-      }}
-      
-      thead tr {{
-        position: absolute;
-        top: -9999px;
-        left: -9999px;
-      }}
-      
-      tbody tr {{
-        border: 1px solid #1f2937;
-        border-radius: 0.5rem;
-        margin-bottom: 0.75rem;
-        padding: 0.75rem;
-        background: rgba(15, 23, 42, 0.7);
-        position: relative;
-      }}
-      
-      tbody tr.best-single-hour {{
-        background: rgba(34, 197, 94, 0.12);
-        border: 1px solid rgba(34, 197, 94, 0.3);
-      }}
-      
-      tbody tr.best-single-hour::before {{
-        content: "★ LAAGSTE PRIJS";
-        position: absolute;
-        top: 0.5rem;
-        right: 0.75rem;
-        font-size: 0.7rem;
-        color: #22c55e;
-        font-weight: bold;
-      }}
-      
-      td {{
-        border: none;
-        border-bottom: 1px solid #1f2937;
-        position: relative;
-        padding: 0.4rem 0 0.4rem 45%;
-        text-align: left !important;
-        white-space: normal;
-      }}
-      
-      td:last-child {{
-        border-bottom: none;
-      }}
-      
-      td:before {{
-        content: attr(data-label) ": ";
-        position: absolute;
-        left: 0;
-        width: 40%;
-        padding-right: 10px;
-        white-space: nowrap;
-        color: #9ca3af;
-        font-weight: bold;
-        font-size: 0.75rem;
-      }}
-      
-      .bar-cell {{
-        width: auto;
-      }}
-      
-      .bar-wrapper {{
-        margin-top: 0.25rem;
-      }}
-    }}
-
-    .note {{
-      margin-top: 0.75rem;
-      font-size: 0.8rem;
-      color: #9ca3af;
-    }}
-
-    .small {{
-      font-size: 0.75rem;
-    }}
-
-    .status-box {{
-      margin-top: 0.75rem;
-      font-size: 0.8rem;
-      color: #9ca3af;
-    }}
-
-    .tips {{
-      margin-top: 1rem;
-      padding: 1rem;
-      background: rgba(34, 197, 94, 0.1);
-      border: 1px solid rgba(34, 197, 94, 0.3);
-      border-radius: 1rem;
-    }}
-
-    .tips h3 {{
-      margin-top: 0;
-      font-size: 1rem;
-      color: #bbf7d0;
-    }}
-
-    .tips p {{
-      margin: 0.25rem 0;
-      font-size: 0.85rem;
-      color: #d1fae5;
-    }}
-  </style>
-</head>
-<body>
-  <div class="card">
-    <h1>Belgian Day-Ahead Electricity Prices</h1>
-    <p class="small">
-      Officiële dag-vooruit elektriciteitsprijzen van de Belgische elektriciteitsmarkt.
-      Data van ENTSO-E Transparency Platform via geautomatiseerde GitHub Actions.
-    </p>
-
-    <div class="status-box">
-      Laatste update: {retrieved_display} • Data voor: {date_display}
-    </div>
-
-    <div class="results">
-      <div>
-        <div class="summary">
-          <h2>Prijsoverzicht</h2>
-          <p><strong>Gemiddelde prijs:</strong> €{avg_price:.2f}/MWh</p>
-          <p><strong>Laagste prijs:</strong> €{min_price:.2f}/MWh (uur {min_hour:02d})</p>
-          <p><strong>Hoogste prijs:</strong> €{max_price:.2f}/MWh (uur {max_hour:02d})</p>
-          <p><strong>Datapunten:</strong> {metadata.get('data_points', 0)} uurprijzen</p>
-        </div>
-
-        <div class="tips">
-          <h3>🏠 Beste tijden voor huishoudtoestellen</h3>
-          {format_cheapest_blocks_html(metadata.get('cheapest_blocks', {}))}
-        </div>
-      </div>
-
-      <div>
-        <table>
-          <thead>
-            <tr>
-              <th>Uurblok</th>
-              <th>Prijs (€/MWh)</th>
-              <th>Prijs (ct/kWh)</th>
-              <th class="bar-cell">Relatief niveau</th>
-            </tr>
-          </thead>
-          {format_price_table(prices)}
-        </table>
-        <div class="note">
-          Balkjes tonen de relatieve prijs t.o.v. de duurste uurprijs van de dag.
-          ★ = Laagste prijs van de dag.
-        </div>
-      </div>
-    </div>
-
-    <div class="note" style="text-align: center; margin-top: 2rem; border-top: 1px solid #1f2937; padding-top: 1rem;">
-      Data: {metadata.get('source', 'ENTSO-E Transparency Platform')} • 
-      <a href="https://github.com/dsoubry/machinery" style="color: #22c55e;">GitHub</a> • 
-      <a href="https://transparency.entsoe.eu/" style="color: #22c55e;">ENTSO-E</a>
-    </div>
-  </div>
-</body>
-</html>'''
-    
-    return html
+    parts.append('</tbody>')
+    return ''.join(parts)
 
 def generate_error_page():
     """Generate error page matching the dark theme"""
@@ -480,82 +216,50 @@ def generate_error_page():
 </body>
 </html>'''
 
-    return html
+@functools.lru_cache(maxsize=64)
+def format_tab_label(date_str):
+    """Format an ISO date as a tab label like 'Wo 10/12'; None if it isn't a date"""
+    # Check the shape up front so missing or placeholder dates don't go through an exception
+    if not date_str or not date_str[:4].isdigit():
+        return None
+    try:
+        day_date = datetime.fromisoformat(date_str).date()
+    except ValueError:
+        return None
+    return f"{DUTCH_SHORT_DAY_NAMES[day_date.weekday()]} {day_date.day}/{day_date.month}"
 
 def generate_tabs_html(days_data):
     """Generate tabs HTML with actual dates as labels"""
-    tabs_html = '<div class="tabs">\n'
+    parts = ['<div class="tabs">\n']
     
     for day_key, day_data in days_data.items():
         # Get the date from the actual data
         day_metadata = day_data.get('metadata', {})
         day_date_str = day_metadata.get('date', '')
+        # Fallback to day key if the date can't be read
+        label = format_tab_label(day_date_str) or day_key.title()
         
-        try:
-            day_date = datetime.fromisoformat(day_date_str).date()
-            
-            # Format as "Woensdag 10/12"
-            day_names = {
-                'Monday': 'Ma', 'Tuesday': 'Di', 'Wednesday': 'Wo',
-                'Thursday': 'Do', 'Friday': 'Vr', 'Saturday': 'Za', 'Sunday': 'Zo'
-            }
-            day_name = day_names.get(day_date.strftime('%A'), day_date.strftime('%a'))
-            label = f"{day_name} {day_date.day}/{day_date.month}"
-                
-        except (ValueError, TypeError):
-            # Fallback to day key if date parsing fails
-            label = day_key.title()
-        
-        tabs_html += f'  <div class="tab" id="tab-{day_key}" onclick="showDay(\'{day_key}\')">{label}</div>\n'
+        parts.append(f'  <div class="tab" id="tab-{day_key}" onclick="showDay(\'{day_key}\')">{label}</div>\n')
     
-    tabs_html += '</div>\n'
-    return tabs_html
+    parts.append('</div>\n')
+    return ''.join(parts)
 
-def generate_day_content_html(day_key, day_data):
-    """Generate content HTML for a single day"""
-    metadata = day_data.get('metadata', {})
-    prices = day_data.get('prices', [])
-    
-    # Parse date for display
-    try:
-        date_obj = datetime.fromisoformat(metadata.get('date', ''))
-        date_display = date_obj.strftime('%A %d %B %Y')
-        # Dutch day names
-        date_dutch = {
-            'Monday': 'maandag', 'Tuesday': 'dinsdag', 'Wednesday': 'woensdag',
-            'Thursday': 'donderdag', 'Friday': 'vrijdag', 'Saturday': 'zaterdag', 'Sunday': 'zondag',
-            'January': 'januari', 'February': 'februari', 'March': 'maart', 'April': 'april',
-            'May': 'mei', 'June': 'juni', 'July': 'juli', 'August': 'augustus',
-            'September': 'september', 'October': 'oktober', 'November': 'november', 'December': 'december'
-        }
-        for en, nl in date_dutch.items():
-            date_display = date_display.replace(en, nl)
-    except:
-        date_display = metadata.get('date', 'Onbekend')
-    
-    # Statistics
-    stats = metadata.get('statistics', {})
-    avg_price = stats.get('average_eur_mwh', 0)
-    min_price = stats.get('min_eur_mwh', 0)
-    max_price = stats.get('max_eur_mwh', 0)
-    min_hour = stats.get('min_hour', 0)
-    max_hour = stats.get('max_hour', 0)
-    
-    content_html = f'''
-    <div class="tab-content" id="content-{day_key}">
+# Per-day tab content; all values are substituted as preformatted strings
+DAY_CONTENT_TEMPLATE = string.Template('''
+    <div class="tab-content" id="content-$day_key">
       <div class="results">
         <div>
           <div class="summary">
-            <h2>Prijsoverzicht - {date_display}</h2>
-            <p><strong>Gemiddelde prijs:</strong> €{avg_price:.2f}/MWh</p>
-            <p><strong>Laagste prijs:</strong> €{min_price:.2f}/MWh (uur {min_hour:02d})</p>
-            <p><strong>Hoogste prijs:</strong> €{max_price:.2f}/MWh (uur {max_hour:02d})</p>
-            <p><strong>Datapunten:</strong> {metadata.get('data_points', 0)} uurprijzen</p>
+            <h2>Prijsoverzicht - $date_display</h2>
+            <p><strong>Gemiddelde prijs:</strong> €$avg_price/MWh</p>
+            <p><strong>Laagste prijs:</strong> €$min_price/MWh (uur $min_hour)</p>
+            <p><strong>Hoogste prijs:</strong> €$max_price/MWh (uur $max_hour)</p>
+            <p><strong>Datapunten:</strong> $data_points uurprijzen</p>
           </div>
 
           <div class="tips">
             <h3>🏠 Beste tijden voor huishoudtoestellen</h3>
-            {format_cheapest_blocks_html(metadata.get('cheapest_blocks', {}))}
+            $blocks_html
           </div>
         </div>
 
@@ -569,7 +273,7 @@ def generate_day_content_html(day_key, day_data):
                 <th class="bar-cell">Relatief niveau</th>
               </tr>
             </thead>
-            {format_price_table(prices)}
+            $table_html
           </table>
           <div class="note">
             Balkjes tonen de relatieve prijs t.o.v. de duurste uurprijs van de dag.
@@ -578,15 +282,60 @@ def generate_day_content_html(day_key, day_data):
         </div>
       </div>
     </div>
-    '''
+    ''')
+
+def generate_day_content_html(day_key, day_data):
+    """Generate content HTML for a single day"""
+    metadata = day_data.get('metadata', {})
+    prices = day_data.get('prices', [])
+    
+    # Parse date for display
+    date_display = format_date_dutch(metadata.get('date', 'Onbekend'))
     
-    return content_html
+    # Statistics
+    stats = metadata.get('statistics', {})
+    avg_price = f"{stats.get('average_eur_mwh', 0):.2f}"
+    min_price = f"{stats.get('min_eur_mwh', 0):.2f}"
+    max_price = f"{stats.get('max_eur_mwh', 0):.2f}"
+    min_hour = f"{stats.get('min_hour', 0):02d}"
+    max_hour = f"{stats.get('max_hour', 0):02d}"
+    data_points = metadata.get('data_points', 0)
+    
+    blocks_html = format_cheapest_blocks_html(metadata.get('cheapest_blocks', {}))
+    table_html = format_price_table(prices, stats.get('min_eur_mwh'), stats.get('max_eur_mwh'))
+    
+    return DAY_CONTENT_TEMPLATE.substitute(
+        day_key=day_key,
+        date_display=date_display,
+        avg_price=avg_price,
+        min_price=min_price,
+        min_hour=min_hour,
+        max_price=max_price,
+        max_hour=max_hour,
+        data_points=data_points,
+        blocks_html=blocks_html,
+        table_html=table_html,
+    )
+
+def read_latest_bytes():
+    """Return the raw bytes of latest.json, or None if it doesn't exist"""
+    try:
+        with open('latest.json', 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def load_latest_data(raw):
+    """Load the latest price data (supports both single and multi-day format)
 
-def load_latest_data():
-    """Load the latest price data (supports both single and multi-day format)"""
+    raw holds the bytes of latest.json as returned by read_latest_bytes(), so the file is read once.
+    """
+    if raw is None:
+        print("❌ Geen latest.json gevonden")
+        return None
+    
     try:
-        with open('latest.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = json_loads(raw)
         
         # Check if it's the new multi-day format
         if 'days' in data:
@@ -605,328 +354,326 @@ def load_latest_data():
                 }
             }
             
-    except FileNotFoundError:
-        print("❌ Geen latest.json gevonden")
-        return None
     except json.JSONDecodeError:
         print("❌ Ongeldige JSON in latest.json")
         return None
 
-def generate_html_report(data):
-    """Generate HTML report with support for multiple days"""
-    if not data:
-        return generate_error_page()
-    
-    # Check if we have multi-day data
-    days_data = data.get('days', {})
-    if not days_data:
-        return generate_error_page()
-    
-    # Get available days
-    available_days = list(days_data.keys())
-    primary_day = available_days[0] if available_days else None
-    
-    if not primary_day:
-        return generate_error_page()
-    
-    # Generate tabs and content for each day
-    tabs_html = generate_tabs_html(days_data)
-    day_contents_html = ""
-    
-    for day_key, day_data in days_data.items():
-        day_content = generate_day_content_html(day_key, day_data)
-        day_contents_html += day_content
-    
-    # Get retrieved timestamp from main metadata
-    main_metadata = data.get('metadata', {})
-    retrieved_at = main_metadata.get('retrieved_at', '')
-    try:
-        retrieved_dt = datetime.fromisoformat(retrieved_at)
-        retrieved_display = retrieved_dt.strftime('%d/%m/%Y om %H:%M')
-    except:
-        retrieved_display = 'Onbekend'
-    
-    html = f'''<!DOCTYPE html>
+# Stylesheet and tab script, written next to index.html so browsers can cache them across updates
+REPORT_CSS = ''':root {
+  font-family: system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
+  color-scheme: light dark;
+}
+
+body {
+  margin: 0;
+  padding: 1.5rem;
+  background: #0f172a;
+  color: #e5e7eb;
+}
+
+h1 {
+  margin-top: 0;
+  font-size: 1.6rem;
+}
+
+.card {
+  max-width: 1200px;
+  margin: 0 auto;
+  background: rgba(15, 23, 42, 0.9);
+  border-radius: 1rem;
+  padding: 1.5rem;
+  box-shadow: 0 20px 40px rgba(0, 0, 0, 0.35);
+  border: 1px solid rgba(148, 163, 184, 0.5);
+}
+
+.tabs {
+  display: flex;
+  gap: 0.5rem;
+  margin-bottom: 1.5rem;
+  border-bottom: 1px solid #1f2937;
+}
+
+.tab {
+  padding: 0.75rem 1.5rem;
+  background: rgba(31, 41, 55, 0.5);
+  border: 1px solid rgba(75, 85, 99, 0.5);
+  border-bottom: none;
+  border-radius: 0.5rem 0.5rem 0 0;
+  cursor: pointer;
+  transition: all 0.2s ease;
+  color: #9ca3af;
+}
+
+.tab:hover {
+  background: rgba(34, 197, 94, 0.1);
+  color: #bbf7d0;
+}
+
+.tab.active {
+  background: rgba(34, 197, 94, 0.2);
+  border-color: rgba(34, 197, 94, 0.5);
+  color: #bbf7d0;
+  font-weight: bold;
+}
+
+.tab-content {
+  display: none;
+}
+
+.tab-content.active {
+  display: block;
+}
+
+.results {
+  display: grid;
+  grid-template-columns: minmax(0, 2fr) minmax(0, 3fr);
+  gap: 1.5rem;
+}
+
+@media (max-width: 800px) {
+  .results {
+    grid-template-columns: 1fr;
+  }
+
+  .tabs {
+    flex-direction: column;
+  }
+
+  .tab {
+    text-align: center;
+  }
+}
+
+.summary {
+  border-radius: 1rem;
+  padding: 1rem;
+  background: radial-gradient(circle at top left, rgba(34, 197, 94, 0.3), rgba(15, 23, 42, 0.9));
+  border: 1px solid rgba(34, 197, 94, 0.5);
+  min-height: 110px;
+}
+
+.summary h2 {
+  margin-top: 0;
+  font-size: 1.1rem;
+}
+
+.summary p {
+  margin: 0.15rem 0;
+  font-size: 0.9rem;
+}
+
+.summary strong {
+  color: #bbf7d0;
+}
+
+table {
+  width: 100%;
+  border-collapse: collapse;
+  font-size: 0.85rem;
+  overflow: hidden;
+  border-radius: 1rem;
+}
+
+thead {
+  background: #020617;
+}
+
+th, td {
+  padding: 0.4rem 0.5rem;
+  text-align: right;
+  border-bottom: 1px solid #1f2937;
+  white-space: nowrap;
+}
+
+th:first-child, td:first-child {
+  text-align: left;
+}
+
+tbody tr:nth-child(even) {
+  background: rgba(15, 23, 42, 0.7);
+}
+
+.best-single-hour {
+  background: rgba(34, 197, 94, 0.12) !important;
+  position: relative;
+}
+
+.best-single-hour::before {
+  content: "★";
+  position: absolute;
+  left: 4px;
+  top: 50%;
+  transform: translateY(-50%);
+  font-size: 0.7rem;
+  color: #22c55e;
+}
+
+.bar-cell {
+  width: 35%;
+}
+
+.bar-wrapper {
+  height: 8px;
+  border-radius: 999px;
+  background: rgba(31, 41, 55, 0.9);
+  overflow: hidden;
+}
+
+.bar {
+  height: 100%;
+  border-radius: inherit;
+  background: linear-gradient(90deg, #22c55e, #fbbf24, #f97316, #ef4444);
+  width: 0%;
+  transition: width 0.3s ease;
+}
+
+.note {
+  margin-top: 0.75rem;
+  font-size: 0.8rem;
+  color: #9ca3af;
+}
+
+.small {
+  font-size: 0.75rem;
+}
+
+.status-box {
+  margin-top: 0.75rem;
+  font-size: 0.8rem;
+  color: #9ca3af;
+}
+
+.tips {
+  margin-top: 1rem;
+  padding: 1rem;
+  background: rgba(34, 197, 94, 0.1);
+  border: 1px solid rgba(34, 197, 94, 0.3);
+  border-radius: 1rem;
+}
+
+.tips h3 {
+  margin-top: 0;
+  font-size: 1rem;
+  color: #bbf7d0;
+}
+
+.tips p {
+  margin: 0.25rem 0;
+  font-size: 0.85rem;
+  color: #d1fae5;
+}
+
+/* Mobile responsive table */
+@media (max-width: 600px) {
+  table, thead, tbody, th, td, tr {
+    display: block;
+  }
+
+  thead tr {
+    position: absolute;
+    top: -9999px;
+    left: -9999px;
+  }
+
+  tbody tr {
+    border: 1px solid #1f2937;
+    border-radius: 0.5rem;
+    margin-bottom: 0.75rem;
+    padding: 0.75rem;
+    background: rgba(15, 23, 42, 0.7);
+    position: relative;
+  }
+
+  tbody tr.best-single-hour {
+    background: rgba(34, 197, 94, 0.12);
+    border: 1px solid rgba(34, 197, 94, 0.3);
+  }
+
+  tbody tr.best-single-hour::before {
+    content: "★ LAAGSTE PRIJS";
+    position: absolute;
+    top: 0.5rem;
+    right: 0.75rem;
+    font-size: 0.7rem;
+    color: #22c55e;
+    font-weight: bold;
+  }
+
+  td {
+    border: none;
+    border-bottom: 1px solid #1f2937;
+    position: relative;
+    padding: 0.4rem 0 0.4rem 45%;
+    text-align: left !important;
+    white-space: normal;
+  }
+
+  td:last-child {
+    border-bottom: none;
+  }
+
+  td:before {
+    content: attr(data-label) ": ";
+    position: absolute;
+    left: 0;
+    width: 40%;
+    padding-right: 10px;
+    white-space: nowrap;
+    color: #9ca3af;
+    font-weight: bold;
+    font-size: 0.75rem;
+  }
+
+  .bar-cell {
+    width: auto;
+  }
+
+  .bar-wrapper {
+    margin-top: 0.25rem;
+  }
+}
+'''
+
+REPORT_JS = '''function showDay(dayKey) {
+  // Hide all tab contents
+  document.querySelectorAll('.tab-content').forEach(el => {
+    el.classList.remove('active');
+  });
+
+  // Hide all tabs
+  document.querySelectorAll('.tab').forEach(el => {
+    el.classList.remove('active');
+  });
+
+  // Show selected tab and content
+  document.getElementById('tab-' + dayKey).classList.add('active');
+  document.getElementById('content-' + dayKey).classList.add('active');
+}
+
+// Show first tab by default
+document.addEventListener('DOMContentLoaded', function() {
+  const firstTab = document.querySelector('.tab');
+  if (firstTab) {
+    firstTab.click();
+  }
+});
+'''
+
+def asset_version(content):
+    """Short content hash for an asset URL, so a changed stylesheet or script bypasses browser caches"""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=4).hexdigest()
+
+REPORT_CSS_VERSION = asset_version(REPORT_CSS)
+REPORT_JS_VERSION = asset_version(REPORT_JS)
+
+# Static page head, shared by every render
+REPORT_PAGE_HEAD = f'''<!DOCTYPE html>
 <html lang="nl">
 <head>
   <meta charset="UTF-8">
   <title>Belgian Day-Ahead Electricity Prices</title>
   <meta name="viewport" content="width=device-width, initial-scale=1">
-  <style>
-    :root {{
-      font-family: system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
-      color-scheme: light dark;
-    }}
-
-    body {{
-      margin: 0;
-      padding: 1.5rem;
-      background: #0f172a;
-      color: #e5e7eb;
-    }}
-
-    h1 {{
-      margin-top: 0;
-      font-size: 1.6rem;
-    }}
-
-    .card {{
-      max-width: 1200px;
-      margin: 0 auto;
-      background: rgba(15, 23, 42, 0.9);
-      border-radius: 1rem;
-      padding: 1.5rem;
-      box-shadow: 0 20px 40px rgba(0, 0, 0, 0.35);
-      border: 1px solid rgba(148, 163, 184, 0.5);
-    }}
-
-    .tabs {{
-      display: flex;
-      gap: 0.5rem;
-      margin-bottom: 1.5rem;
-      border-bottom: 1px solid #1f2937;
-    }}
-
-    .tab {{
-      padding: 0.75rem 1.5rem;
-      background: rgba(31, 41, 55, 0.5);
-      border: 1px solid rgba(75, 85, 99, 0.5);
-      border-bottom: none;
-      border-radius: 0.5rem 0.5rem 0 0;
-      cursor: pointer;
-      transition: all 0.2s ease;
-      color: #9ca3af;
-    }}
-
-    .tab:hover {{
-      background: rgba(34, 197, 94, 0.1);
-      color: #bbf7d0;
-    }}
-
-    .tab.active {{
-      background: rgba(34, 197, 94, 0.2);
-      border-color: rgba(34, 197, 94, 0.5);
-      color: #bbf7d0;
-      font-weight: bold;
-    }}
-
-    .tab-content {{
-      display: none;
-    }}
-
-    .tab-content.active {{
-      display: block;
-    }}
-
-    .results {{
-      display: grid;
-      grid-template-columns: minmax(0, 2fr) minmax(0, 3fr);
-      gap: 1.5rem;
-    }}
-
-    @media (max-width: 800px) {{
-      .results {{
-        grid-template-columns: 1fr;
-      }}
-      
-      .tabs {{
-        flex-direction: column;
-      }}
-      
-      .tab {{
-        text-align: center;
-      }}
-    }}
-
-    .summary {{
-      border-radius: 1rem;
-      padding: 1rem;
-      background: radial-gradient(circle at top left, rgba(34, 197, 94, 0.3), rgba(15, 23, 42, 0.9));
-      border: 1px solid rgba(34, 197, 94, 0.5);
-      min-height: 110px;
-    }}
-
-    .summary h2 {{
-      margin-top: 0;
-      font-size: 1.1rem;
-    }}
-
-    .summary p {{
-      margin: 0.15rem 0;
-      font-size: 0.9rem;
-    }}
-
-    .summary strong {{
-      color: #bbf7d0;
-    }}
-
-    table {{
-      width: 100%;
-      border-collapse: collapse;
-      font-size: 0.85rem;
-      overflow: hidden;
-      border-radius: 1rem;
-    }}
-
-    thead {{
-      background: #020617;
-    }}
-
-    th, td {{
-      padding: 0.4rem 0.5rem;
-      text-align: right;
-      border-bottom: 1px solid #1f2937;
-      white-space: nowrap;
-    }}
-
-    th:first-child, td:first-child {{
-      text-align: left;
-    }}
-
-    tbody tr:nth-child(even) {{
-      background: rgba(15, 23, 42, 0.7);
-    }}
-
-    .best-single-hour {{
-      background: rgba(34, 197, 94, 0.12) !important;
-      position: relative;
-    }}
-
-    .best-single-hour::before {{
-      content: "★";
-      position: absolute;
-      left: 4px;
-      top: 50%;
-      transform: translateY(-50%);
-      font-size: 0.7rem;
-      color: #22c55e;
-    }}
-
-    .bar-cell {{
-      width: 35%;
-    }}
-
-    .bar-wrapper {{
-      height: 8px;
-      border-radius: 999px;
-      background: rgba(31, 41, 55, 0.9);
-      overflow: hidden;
-    }}
-
-    .bar {{
-      height: 100%;
-      border-radius: inherit;
-      background: linear-gradient(90deg, #22c55e, #fbbf24, #f97316, #ef4444);
-      width: 0%;
-      transition: width 0.3s ease;
-    }}
-
-    .note {{
-      margin-top: 0.75rem;
-      font-size: 0.8rem;
-      color: #9ca3af;
-    }}
-
-    .small {{
-      font-size: 0.75rem;
-    }}
-
-    .status-box {{
-      margin-top: 0.75rem;
-      font-size: 0.8rem;
-      color: #9ca3af;
-    }}
-
-    .tips {{
-      margin-top: 1rem;
-      padding: 1rem;
-      background: rgba(34, 197, 94, 0.1);
-      border: 1px solid rgba(34, 197, 94, 0.3);
-      border-radius: 1rem;
-    }}
-
-    .tips h3 {{
-      margin-top: 0;
-      font-size: 1rem;
-      color: #bbf7d0;
-    }}
-
-    .tips p {{
-      margin: 0.25rem 0;
-      font-size: 0.85rem;
-      color: #d1fae5;
-    }}
-
-    /* Mobile responsive table */
-    @media (max-width: 600px) {{
-      table, thead, tbody, th, td, tr {{
-        display: block;
-      }}
-      
-      thead tr {{
-        position: absolute;
-        top: -9999px;
-        left: -9999px;
-      }}
-      
-      tbody tr {{
-        border: 1px solid #1f2937;
-        border-radius: 0.5rem;
-        margin-bottom: 0.75rem;
-        padding: 0.75rem;
-        background: rgba(15, 23, 42, 0.7);
-        position: relative;
-      }}
-      
-      tbody tr.best-single-hour {{
-        background: rgba(34, 197, 94, 0.12);
-        border: 1px solid rgba(34, 197, 94, 0.3);
-      }}
-      
-      tbody tr.best-single-hour::before {{
-        content: "★ LAAGSTE PRIJS";
-        position: absolute;
-        top: 0.5rem;
-        right: 0.75rem;
-        font-size: 0.7rem;
-        color: #22c55e;
-        font-weight: bold;
-      }}
-      
-      td {{
-        border: none;
-        border-bottom: 1px solid #1f2937;
-        position: relative;
-        padding: 0.4rem 0 0.4rem 45%;
-        text-align: left !important;
-        white-space: normal;
-      }}
-      
-      td:last-child {{
-        border-bottom: none;
-      }}
-      
-      td:before {{
-        content: attr(data-label) ": ";
-        position: absolute;
-        left: 0;
-        width: 40%;
-        padding-right: 10px;
-        white-space: nowrap;
-        color: #9ca3af;
-        font-weight: bold;
-        font-size: 0.75rem;
-      }}
-      
-      .bar-cell {{
-        width: auto;
-      }}
-      
-      .bar-wrapper {{
-        margin-top: 0.25rem;
-      }}
-    }}
-  </style>
+  <link rel="stylesheet" href="report.css?v={REPORT_CSS_VERSION}">
 </head>
 <body>
   <div class="card">
@@ -936,14 +683,20 @@ def generate_html_report(data):
       Data van ENTSO-E Transparency Platform via geautomatiseerde GitHub Actions.
     </p>
 
-    <div class="status-box">
-      Laatste update: {retrieved_display} • {len(days_data)} dag(en) beschikbaar
+'''
+
+# Dynamic middle of the page: status line, tabs and per-day content
+REPORT_PAGE_BODY = string.Template('''    <div class="status-box">
+      Laatste update: $retrieved_display • $day_count dag(en) beschikbaar
     </div>
 
-    {tabs_html}
+    $tabs_html
     
-    {day_contents_html}
+    $day_contents_html
+''')
 
+# Static footer with the tab-switching script
+REPORT_PAGE_FOOT = f'''
     <div class="note" style="text-align: center; margin-top: 2rem; border-top: 1px solid #1f2937; padding-top: 1rem;">
       Data: ENTSO-E Transparency Platform • 
       <a href="https://github.com/dsoubry/machinery" style="color: #22c55e;">GitHub</a> • 
@@ -951,45 +704,130 @@ def generate_html_report(data):
     </div>
   </div>
 
-  <script>
-    function showDay(dayKey) {{
-      // Hide all tab contents
-      document.querySelectorAll('.tab-content').forEach(el => {{
-        el.classList.remove('active');
-      }});
-      
-      // Hide all tabs
-      document.querySelectorAll('.tab').forEach(el => {{
-        el.classList.remove('active');
-      }});
-      
-      // Show selected tab and content
-      document.getElementById('tab-' + dayKey).classList.add('active');
-      document.getElementById('content-' + dayKey).classList.add('active');
-    }}
-    
-    // Show first tab by default
-    document.addEventListener('DOMContentLoaded', function() {{
-      const firstTab = document.querySelector('.tab');
-      if (firstTab) {{
-        firstTab.click();
-      }}
-    }});
-  </script>
+  <script src="report.js?v={REPORT_JS_VERSION}"></script>
 </body>
 </html>'''
+
+def generate_html_report(data):
+    """Generate HTML report with support for multiple days"""
+    if not data:
+        return generate_error_page()
+    
+    # Check if we have multi-day data
+    days_data = data.get('days', {})
+    if not days_data:
+        return generate_error_page()
+    
+    # Get available days
+    available_days = list(days_data.keys())
+    primary_day = available_days[0] if available_days else None
+    
+    if not primary_day:
+        return generate_error_page()
+    
+    # Generate tabs and content for each day
+    tabs_html = generate_tabs_html(days_data)
+    day_contents_html = ''.join(
+        generate_day_content_html(day_key, day_data)
+        for day_key, day_data in days_data.items()
+    )
     
-    return html
+    # Get retrieved timestamp from main metadata
+    main_metadata = data.get('metadata', {})
+    retrieved_display = format_retrieved_at(main_metadata.get('retrieved_at', ''))
+    
+    body_html = REPORT_PAGE_BODY.substitute(
+        retrieved_display=retrieved_display,
+        day_count=len(days_data),
+        tabs_html=tabs_html,
+        day_contents_html=day_contents_html,
+    )
+    return ''.join((REPORT_PAGE_HEAD, body_html, REPORT_PAGE_FOOT))
+
+REPORT_HASH_FILE = '.index.html.hash'
+
+# Everything a render writes; a missing one forces a fresh render
+REPORT_OUTPUT_FILES = ('index.html', 'index.html.gz', 'report.css', 'report.js')
+if brotli:
+    REPORT_OUTPUT_FILES += ('index.html.br',)
+
+def write_bytes_atomic(path, payload):
+    """Write bytes to a temp file and swap it into place, so readers never see a half-written file"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+def write_if_changed(path, content):
+    """Write a text file only when its content differs, so its mtime (and browser caches) stay valid"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return
+    except FileNotFoundError:
+        pass
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+def report_fingerprint(raw):
+    """Hash the latest.json bytes together with this generator, or None if there is no data file"""
+    if raw is None:
+        return None
+    
+    # Include the generator source so template/code changes also force a re-render
+    with open(__file__, 'rb') as f:
+        source = f.read()
+    
+    return hashlib.blake2b(raw + b'\0' + source, digest_size=16).hexdigest()
 
 def main():
     """Generate HTML report matching original design"""
     print("🌐 Generating HTML report with original dark theme...")
     
-    data = load_latest_data()
-    html_content = generate_html_report(data)
-    
-    with open('index.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Skip the whole render when neither the data nor the generator changed (local re-runs;
+    # in CI the scraper rewrites latest.json first, so the report is always rendered there)
+    raw = read_latest_bytes()
+    fingerprint = report_fingerprint(raw)
+    if fingerprint and all(os.path.exists(name) for name in REPORT_OUTPUT_FILES):
+        try:
+            with open(REPORT_HASH_FILE, 'r', encoding='utf-8') as f:
+                if f.read().strip() == fingerprint:
+                    print("✅ index.html already up to date (latest.json unchanged)")
+                    return
+        except FileNotFoundError:
+            pass
+    
+    # Rendering only creates short-lived strings, so skip cyclic GC passes meanwhile
+    gc.disable()
+    try:
+        data = load_latest_data(raw)
+        html_content = generate_html_report(data)
+    finally:
+        gc.enable()
+    
+    write_if_changed('report.css', REPORT_CSS)
+    write_if_changed('report.js', REPORT_JS)
+    
+    payload = html_content.encode('utf-8')
+    write_bytes_atomic('index.html', payload)
+    
+    # Precompressed copy for hosts that serve Content-Encoding: gzip directly
+    write_bytes_atomic('index.html.gz', gzip.compress(payload, compresslevel=9, mtime=0))
+    if brotli:
+        write_bytes_atomic('index.html.br', brotli.compress(payload, quality=11))
+    else:
+        # Don't leave an older brotli copy behind next to the fresh page
+        try:
+            os.remove('index.html.br')
+        except FileNotFoundError:
+            pass
+
+    # Written last, so an interrupted run never leaves a stale fingerprint behind
+    if fingerprint:
+        with open(REPORT_HASH_FILE, 'w', encoding='utf-8') as f:
+            f.write(fingerprint + '\n')
+    elif os.path.exists(REPORT_HASH_FILE):
+        os.remove(REPORT_HASH_FILE)
     
     print("✅ Dark theme index.html generated")
 
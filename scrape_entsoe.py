@@ -8,13 +8,25 @@ Belgian Day-Ahead Price Scraper
 
 import os
 import sys
+import csv
 import json
+import functools
 import re
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
-import xml.etree.ElementTree as ET
+
+try:
+    import orjson  # optional: native JSON encoder, stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+try:
+    from lxml import etree as ET  # optional: C parser with the same API, stdlib is the fallback
+except ImportError:
+    import xml.etree.ElementTree as ET
 
 # ENTSO-E API Configuration
 ENTSOE_TOKEN = os.getenv('ENTSOE_TOKEN', '')
@@ -22,11 +34,20 @@ ENTSOE_API_URL = 'https://web-api.tp.entsoe.eu/api'
 BELGIUM_DOMAIN = '10YBE----------2'
 BRUSSELS_TZ = ZoneInfo('Europe/Brussels')
 
+# One pooled HTTP session, so the today/tomorrow/fallback requests reuse their TLS connections.
+# Transient gateway errors are retried up to 3 times with short backoff (a few seconds in total);
+# Retry-After is ignored so a server can't stretch that to hours. If the errors persist the last
+# response is returned as-is, so a lasting 503 still ends up in the dayaheadmarket.eu fallback.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount('https://', HTTPAdapter(pool_maxsize=4, max_retries=Retry(
+    total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504),
+    allowed_methods=('GET',), raise_on_status=False,
+    respect_retry_after_header=False)))
 
-def get_entsoe_token():
-    """Get ENTSO-E API token from environment or exit with instructions"""
-    global ENTSOE_TOKEN
 
+@functools.lru_cache(maxsize=1)
+def get_entsoe_token():
+    """Get ENTSO-E API token from environment or exit with instructions (checked once per run)"""
     if not ENTSOE_TOKEN:
         print("❌ ENTSO-E API token niet gevonden!")
         print("🔧 Vereiste stappen:")
@@ -39,15 +60,44 @@ def get_entsoe_token():
     return ENTSOE_TOKEN
 
 
+# ISO timestamps are cached since the same strings recur per run
+if sys.version_info >= (3, 11):
+    parse_iso_timestamp = functools.lru_cache(maxsize=256)(datetime.fromisoformat)  # accepts a trailing 'Z' natively
+else:
+    @functools.lru_cache(maxsize=256)
+    def parse_iso_timestamp(text):
+        """Parse an ISO-8601 timestamp, accepting a trailing 'Z' for UTC"""
+        if text.endswith('Z'):
+            text = text[:-1] + '+00:00'
+        return datetime.fromisoformat(text)
+
+
+def format_time_hhmm(iso_str):
+    """Format an ISO timestamp string as HH:MM"""
+    dt = parse_iso_timestamp(iso_str)
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
 def validate_price_data(prices):
     """Validate price data for suspicious values"""
     if not prices:
         return False, "No prices found"
 
-    price_values = [p['price_eur_mwh'] for p in prices]
-    max_price = max(price_values)
-    min_price = min(price_values)
-    avg_price = sum(price_values) / len(price_values)
+    # Bounds, sum and (up to 5) distinct prices in one pass; the distinct check only needs to
+    # know whether there are fewer than 5, so the set stops growing once it reaches that
+    min_price = max_price = prices[0]['price_eur_mwh']
+    total = 0.0
+    distinct_prices = set()
+    for p in prices:
+        value = p['price_eur_mwh']
+        total += value
+        if value < min_price:
+            min_price = value
+        elif value > max_price:
+            max_price = value
+        if len(distinct_prices) < 5:
+            distinct_prices.add(value)
+    avg_price = total / len(prices)
 
     issues = []
 
@@ -60,7 +110,7 @@ def validate_price_data(prices):
     if max_price > 10 * avg_price and max_price > 100:
         issues.append(f"Price spike: €{max_price:.2f}/MWh (avg: €{avg_price:.2f}/MWh)")
 
-    if len(set(price_values)) < 5:
+    if len(distinct_prices) < 5:
         issues.append("Too few unique prices - possible data corruption")
 
     if len(prices) not in [23, 24, 25, 48, 96]:  # 23/25 voor zomer/wintertijd wissel
@@ -92,9 +142,10 @@ def fetch_day_ahead_prices(target_date=None):
     if target_date.tzinfo is None:
         target_date = target_date.replace(tzinfo=BRUSSELS_TZ)
 
-    # Converteer Belgische middernacht naar UTC voor ENTSO-E
+    # Converteer Belgische middernacht naar UTC voor ENTSO-E; het einde is de volgende lokale
+    # middernacht, zodat zomer-/wintertijddagen 23 of 25 uur beslaan in plaats van altijd 24
     start_time_utc = target_date.astimezone(timezone.utc)
-    end_time_utc = start_time_utc + timedelta(days=1)
+    end_time_utc = (target_date + timedelta(days=1)).astimezone(timezone.utc)
 
     start_str = start_time_utc.strftime('%Y%m%d%H%M')
     end_str = end_time_utc.strftime('%Y%m%d%H%M')
@@ -114,7 +165,7 @@ def fetch_day_ahead_prices(target_date=None):
     }
 
     try:
-        response = requests.get(ENTSOE_API_URL, params=params, timeout=30)
+        response = HTTP_SESSION.get(ENTSOE_API_URL, params=params, timeout=30)
 
         print(f"📡 HTTP Status: {response.status_code}")
         print(f"📏 Response length: {len(response.content)} bytes")
@@ -138,8 +189,14 @@ def fetch_day_ahead_prices(target_date=None):
             print(f"❌ XML Parse Error: {e}")
             return None
 
-        if 'no matching data found' in response.text.lower():
-            print("📭 ENTSO-E: No matching data found voor deze periode")
+        # "Geen data"-antwoorden komen terug als Acknowledgement-document; herken dat aan de
+        # root-tag in plaats van de hele response in kleine letters te doorzoeken
+        if root.tag.endswith('Acknowledgement_MarketDocument'):
+            reason = root.findtext('.//{*}Reason/{*}text') or ''
+            if 'no matching data found' in reason.lower():
+                print("📭 ENTSO-E: No matching data found voor deze periode")
+            else:
+                print(f"📭 ENTSO-E: Geen prijsdata in antwoord ({reason or 'geen reden opgegeven'})")
             return None
 
         prices = parse_entsoe_response(root, target_date)
@@ -174,58 +231,83 @@ def parse_entsoe_response(root, target_date):
         ns = {}
         print("🔍 No namespace detected")
 
+    # Namespace-qualified (Clark notation) tags, built once; plain tags like these take
+    # ElementTree's direct child-matching path instead of prefix resolution per lookup
+    tag_prefix = f"{{{ns['ns']}}}" if ns else ''
+    time_series_tag = tag_prefix + 'TimeSeries'
+    period_tag = tag_prefix + 'Period'
+    interval_tag = tag_prefix + 'timeInterval'
+    start_tag = tag_prefix + 'start'
+    resolution_tag = tag_prefix + 'resolution'
+    point_tag = tag_prefix + 'Point'
+    end_tag = tag_prefix + 'end'
+    position_tag = tag_prefix + 'position'
+    price_tag = tag_prefix + 'price.amount'
+
+    # A44 nests TimeSeries > Period > Point as direct children, so look there first and only
+    # fall back to a full descendant search (which also walks every Point) if that finds nothing
     if ns:
-        time_series_list = root.findall('.//ns:TimeSeries', ns)
+        time_series_list = root.findall(time_series_tag) or root.findall('.//' + time_series_tag)
     else:
-        time_series_list = [e for e in root.iter() if e.tag.endswith('TimeSeries')]
+        time_series_list = root.findall('.//{*}TimeSeries')
 
     print(f"🔍 Found {len(time_series_list)} TimeSeries elements")
 
+    if ns:
+        def find_points(period):
+            return period.findall(point_tag) or period.findall('.//' + point_tag)
+    else:
+        def find_points(period):
+            return period.findall('.//{*}Point')
+
+    # Target day as a half-open UTC window [local midnight, next local midnight), so periods
+    # and points are compared as aware datetimes without converting each one to local time
+    target_day = target_date.astimezone(BRUSSELS_TZ).date()
+    target_midnight = datetime(target_day.year, target_day.month, target_day.day, tzinfo=BRUSSELS_TZ)
+    target_start_utc = target_midnight.astimezone(timezone.utc)
+    target_end_utc = (target_midnight + timedelta(days=1)).astimezone(timezone.utc)
+
     all_points = []
 
     for ts_idx, time_series in enumerate(time_series_list):
         print(f"🔍 Processing TimeSeries {ts_idx + 1}")
 
         if ns:
-            periods = time_series.findall('.//ns:Period', ns)
+            periods = time_series.findall(period_tag) or time_series.findall('.//' + period_tag)
         else:
-            periods = [e for e in time_series.iter() if e.tag.endswith('Period')]
+            periods = time_series.findall('.//{*}Period')
 
         print(f"🔍 Found {len(periods)} periods in TimeSeries {ts_idx + 1}")
 
         for period_idx, period in enumerate(periods):
-            start_time_elem = None
+            start_time_elem = end_time_elem = None
 
             if ns:
-                interval = period.find('.//ns:timeInterval', ns)
+                interval = period.find(interval_tag)
                 if interval is not None:
-                    start_time_elem = interval.find('ns:start', ns)
+                    start_time_elem = interval.find(start_tag)
+                    end_time_elem = interval.find(end_tag)
 
             if start_time_elem is None:
-                for elem in period.iter():
-                    if elem.tag.endswith('start'):
-                        start_time_elem = elem
-                        break
+                start_time_elem = period.find('.//{*}start')
+            if end_time_elem is None:
+                end_time_elem = period.find('.//{*}end')
 
             if start_time_elem is None:
                 print(f"⚠️ No start time found in period {period_idx + 1}")
                 continue
 
             try:
-                period_start = datetime.fromisoformat(
-                    start_time_elem.text.replace('Z', '+00:00'))
+                period_start = parse_iso_timestamp(start_time_elem.text)
             except ValueError:
                 print(f"❌ Could not parse start time: {start_time_elem.text}")
                 continue
 
             resolution_elem = None
             if ns:
-                resolution_elem = period.find('.//ns:resolution', ns)
+                resolution_elem = period.find(resolution_tag)
             if resolution_elem is None:
-                for elem in period.iter():
-                    if elem.tag.endswith('resolution'):
-                        resolution_elem = elem
-                        break
+                resolution_elem = period.find('.//{*}resolution')
 
             resolution = resolution_elem.text if resolution_elem is not None else 'PT60M'
 
@@ -236,45 +318,40 @@ def parse_entsoe_response(root, target_date):
             else:
                 time_delta = timedelta(hours=1)
 
-            if ns:
-                points = period.findall('.//ns:Point', ns)
-            else:
-                points = [e for e in period.iter() if e.tag.endswith('Point')]
-
-            if not points:
-                continue
-
-            period_end = period_start + (time_delta * len(points))
-            period_start_local = period_start.astimezone(BRUSSELS_TZ)
-            period_end_local = period_end.astimezone(BRUSSELS_TZ)
-
-            target_date_obj = target_date.astimezone(BRUSSELS_TZ).date()
-            period_start_date = period_start_local.date()
-            period_end_date = period_end_local.date()
+            # Take the period end from its timeInterval when available, so a period that doesn't
+            # cover the target day is skipped before its Points are collected
+            points = None
+            period_end = None
+            if end_time_elem is not None and end_time_elem.text:
+                try:
+                    period_end = parse_iso_timestamp(end_time_elem.text)
+                except ValueError:
+                    pass
 
-            covers_target = (
-                period_start_date <= target_date_obj <= period_end_date or
-                target_date_obj == period_start_date or
-                target_date_obj == period_end_date
-            )
+            if period_end is None:
+                points = find_points(period)
+                if not points:
+                    continue
+                period_end = period_start + (time_delta * len(points))
 
-            if not covers_target:
+            if not (period_start < target_end_utc and period_end > target_start_utc):
                 print(f"⏭️ Skipping period {period_idx + 1} - "
-                      f"covers {period_start_date} to {period_end_date}, need {target_date_obj}")
+                      f"covers {period_start:%Y-%m-%d %H:%M} to {period_end:%Y-%m-%d %H:%M} UTC, "
+                      f"need {target_day}")
                 continue
 
+            if points is None:
+                points = find_points(period)
+                if not points:
+                    continue
+
             print(f"✅ Processing period {period_idx + 1}: "
-                  f"{period_start_local.strftime('%Y-%m-%d %H:%M')} → "
-                  f"{period_end_local.strftime('%Y-%m-%d %H:%M')} "
+                  f"{period_start:%Y-%m-%d %H:%M} → {period_end:%Y-%m-%d %H:%M} UTC "
                   f"({resolution}, {len(points)} punten)")
 
             for point in points:
-                position_elem = price_elem = None
-                for child in point:
-                    if child.tag.endswith('position'):
-                        position_elem = child
-                    elif child.tag.endswith('price.amount'):
-                        price_elem = child
+                position_elem = point.find(position_tag)
+                price_elem = point.find(price_tag)
 
                 if position_elem is None or price_elem is None:
                     continue
@@ -283,11 +360,10 @@ def parse_entsoe_response(root, target_date):
                     position = int(position_elem.text)
                     price = float(price_elem.text)
                     point_time = period_start + (time_delta * (position - 1))
-                    local_time = point_time.astimezone(BRUSSELS_TZ)
 
-                    if local_time.date() == target_date_obj:
+                    if target_start_utc <= point_time < target_end_utc:
                         all_points.append({
-                            'datetime': local_time,
+                            'datetime': point_time.astimezone(BRUSSELS_TZ),
                             'position': position,
                             'price_eur_mwh': price,
                             'price_eur_kwh': price / 1000,
@@ -313,15 +389,17 @@ def parse_entsoe_response(root, target_date):
         print("ℹ️ Data is already hourly")
         hourly_points = all_points
 
-    seen_hours = set()
+    # Points are sorted by local time, so a repeated hour always follows its first occurrence
     unique_points = []
+    last_hour = None
     for point in hourly_points:
-        hour_key = point['datetime'].strftime('%Y-%m-%d %H')
-        if hour_key not in seen_hours:
-            seen_hours.add(hour_key)
+        dt = point['datetime']
+        hour_key = (dt.year, dt.month, dt.day, dt.hour)
+        if hour_key != last_hour:
+            last_hour = hour_key
             unique_points.append(point)
         else:
-            print(f"⚠️ Duplicate hour skipped: {hour_key}")
+            print(f"⚠️ Duplicate hour skipped: {dt.strftime('%Y-%m-%d %H')}")
 
     for i, point in enumerate(unique_points, 1):
         point['hour'] = i
@@ -335,22 +413,26 @@ def convert_to_hourly(points):
     if not points:
         return []
 
+    # Lopende [totaal, aantal] per uur
     hourly_data = {}
     for point in points:
         hour_key = point['datetime'].replace(minute=0, second=0, microsecond=0)
-        if hour_key not in hourly_data:
-            hourly_data[hour_key] = []
-        hourly_data[hour_key].append(point['price_eur_mwh'])
+        bucket = hourly_data.get(hour_key)
+        if bucket is None:
+            hourly_data[hour_key] = [point['price_eur_mwh'], 1]
+        else:
+            bucket[0] += point['price_eur_mwh']
+            bucket[1] += 1
 
     hourly_points = []
-    for hour_time, prices in sorted(hourly_data.items()):
-        avg_price = sum(prices) / len(prices)
+    for hour_time, (total, count) in sorted(hourly_data.items()):
+        avg_price = total / count
         hourly_points.append({
             'datetime': hour_time,
             'price_eur_mwh': avg_price,
             'price_eur_kwh': avg_price / 1000,
             'resolution': 'PT60M',
-            'data_points': len(prices)
+            'data_points': count
         })
 
     print(f"🔄 Converted {len(points)} high-res points to {len(hourly_points)} hourly averages")
@@ -375,7 +457,7 @@ def fetch_from_dayaheadmarket(target_date):
 
     url = 'https://www.dayaheadmarket.eu/belgium'
     try:
-        response = requests.get(url, timeout=15, headers={
+        response = HTTP_SESSION.get(url, timeout=15, headers={
             'User-Agent': 'Mozilla/5.0 (compatible; energy-monitor/1.0)'
         })
 
@@ -463,16 +545,28 @@ def fetch_from_dayaheadmarket(target_date):
 # GEMEENSCHAPPELIJKE FUNCTIES
 # ─────────────────────────────────────────────────────────────
 
-def find_cheapest_block(prices, block_hours=3):
-    """Vind het goedkoopste aaneengesloten blok van N uren"""
+# Blokgroottes (in uren) waarvoor het goedkoopste aaneengesloten blok berekend wordt
+CHEAPEST_BLOCK_HOURS = (1, 2, 3, 4)
+
+
+def find_cheapest_block(prices, block_hours=3, values=None):
+    """Vind het goedkoopste aaneengesloten blok van N uren
+
+    values kan de al uitgepakte €/MWh-prijzen bevatten, zodat meerdere blokgroottes ze delen.
+    """
     if len(prices) < block_hours:
         return None
 
+    if values is None:
+        values = [p['price_eur_mwh'] for p in prices]
+
     best_sum = float('inf')
     best_start_idx = 0
 
-    for i in range(len(prices) - block_hours + 1):
-        block_sum = sum(prices[j]['price_eur_mwh'] for j in range(i, i + block_hours))
+    # Vensters worden van links naar rechts opgeteld; geen prefixsommen, zodat gelijke blokken
+    # en afronding stabiel blijven
+    for i in range(len(values) - block_hours + 1):
+        block_sum = sum(values[i:i + block_hours])
         if block_sum < best_sum:
             best_sum = block_sum
             best_start_idx = i
@@ -480,19 +574,12 @@ def find_cheapest_block(prices, block_hours=3):
     block_prices = prices[best_start_idx:best_start_idx + block_hours]
     avg_price = best_sum / block_hours
 
-    start_dt = block_prices[0]['datetime']
-    end_dt = block_prices[-1]['datetime']
-
-    if hasattr(start_dt, 'isoformat'):
-        start_dt = start_dt.isoformat()
-    if hasattr(end_dt, 'isoformat'):
-        end_dt = end_dt.isoformat()
-
+    # Tijden blijven datetime-objecten; format_price_data zet ze pas bij het wegschrijven om
     return {
         'start_hour': block_prices[0]['hour'],
         'end_hour': block_prices[-1]['hour'],
-        'start_time': start_dt,
-        'end_time': end_dt,
+        'start_time': block_prices[0]['datetime'],
+        'end_time': block_prices[-1]['datetime'],
         'hours': block_hours,
         'average_price': avg_price,
         'total_price': best_sum,
@@ -505,36 +592,35 @@ def format_price_data(prices, target_date, source='ENTSO-E'):
     if not prices:
         return None
 
-    price_values = [p['price_eur_mwh'] for p in prices]
-    avg_price = sum(price_values) / len(price_values)
-    min_price = min(price_values)
-    max_price = max(price_values)
+    # Som, minimum en maximum in één doorloop; bij gelijke prijzen blijft het vroegste uur
+    total = 0.0
+    min_hour_data = max_hour_data = prices[0]
+    for p in prices:
+        value = p['price_eur_mwh']
+        total += value
+        if value < min_hour_data['price_eur_mwh']:
+            min_hour_data = p
+        elif value > max_hour_data['price_eur_mwh']:
+            max_hour_data = p
 
-    min_hour_data = next(p for p in prices if p['price_eur_mwh'] == min_price)
-    max_hour_data = next(p for p in prices if p['price_eur_mwh'] == max_price)
+    avg_price = total / len(prices)
+    min_price = min_hour_data['price_eur_mwh']
+    max_price = max_hour_data['price_eur_mwh']
 
-    cheapest_1h = find_cheapest_block(prices, 1)
-    cheapest_2h = find_cheapest_block(prices, 2)
-    cheapest_3h = find_cheapest_block(prices, 3)
-    cheapest_4h = find_cheapest_block(prices, 4)
+    price_values = [p['price_eur_mwh'] for p in prices]
+    cheapest = {hours: find_cheapest_block(prices, hours, price_values) for hours in CHEAPEST_BLOCK_HOURS}
+    cheapest_3h = cheapest[3]
 
     print(f"📊 Statistieken ({source}):")
     print(f"   Gemiddeld: €{avg_price:.2f}/MWh")
 
-    min_dt = min_hour_data['datetime']
-    max_dt = max_hour_data['datetime']
-    if hasattr(min_dt, 'strftime'):
-        print(f"   Minimum: €{min_price:.2f}/MWh om {min_dt.strftime('%H:%M')}")
-        print(f"   Maximum: €{max_price:.2f}/MWh om {max_dt.strftime('%H:%M')}")
+    print(f"   Minimum: €{min_price:.2f}/MWh om {min_hour_data['datetime']:%H:%M}")
+    print(f"   Maximum: €{max_price:.2f}/MWh om {max_hour_data['datetime']:%H:%M}")
     print(f"   Spread: €{max_price - min_price:.2f}/MWh")
 
     if cheapest_3h:
-        def fmt_time(t):
-            if hasattr(t, 'strftime'):
-                return t.strftime('%H:%M')
-            return datetime.fromisoformat(t.replace('Z', '+00:00')).strftime('%H:%M')
         print(f"💡 Goedkoopste 3u blok: "
-              f"{fmt_time(cheapest_3h['start_time'])}-{fmt_time(cheapest_3h['end_time'])} "
+              f"{cheapest_3h['start_time']:%H:%M}-{cheapest_3h['end_time']:%H:%M} "
               f"(avg: €{cheapest_3h['average_price']:.2f}/MWh)")
 
     def block_dict(b, single=False):
@@ -543,14 +629,14 @@ def format_price_data(prices, target_date, source='ENTSO-E'):
         if single:
             return {
                 'hour': b['start_hour'],
-                'time': b['start_time'],
+                'time': b['start_time'].isoformat(),
                 'price': round(b['average_price'], 2)
             }
         return {
             'start_hour': b['start_hour'],
             'end_hour': b['end_hour'],
-            'start_time': b['start_time'],
-            'end_time': b['end_time'],
+            'start_time': b['start_time'].isoformat(),
+            'end_time': b['end_time'].isoformat(),
             'average_price': round(b['average_price'], 2),
             'hours': b['hours']
         }
@@ -572,28 +658,48 @@ def format_price_data(prices, target_date, source='ENTSO-E'):
                 'price_spread': round(max_price - min_price, 2)
             },
             'cheapest_blocks': {
-                '1_hour': block_dict(cheapest_1h, single=True),
-                '2_hours': block_dict(cheapest_2h),
-                '3_hours': block_dict(cheapest_3h),
-                '4_hours': block_dict(cheapest_4h),
+                ('1_hour' if hours == 1 else f'{hours}_hours'): block_dict(block, single=(hours == 1))
+                for hours, block in cheapest.items()
             }
         },
         'prices': []
     }
 
+    # ct/kWh blijft afgeleid van de onafgeronde €/kWh-waarde: berekend als €/MWh / 10
+    # wordt het voor duizenden prijzen met 2 decimalen anders afgerond
+    price_rows = result['prices']
     for p in prices:
-        dt = p['datetime']
-        result['prices'].append({
+        eur_kwh = p['price_eur_kwh']
+        price_rows.append({
             'hour': p['hour'],
-            'datetime': dt.isoformat() if hasattr(dt, 'isoformat') else dt,
+            'datetime': p['datetime'].isoformat(),
             'price_eur_mwh': round(p['price_eur_mwh'], 2),
-            'price_eur_kwh': round(p['price_eur_kwh'], 4),
-            'price_cent_kwh': round(p['price_eur_kwh'] * 100, 2)
+            'price_eur_kwh': round(eur_kwh, 4),
+            'price_cent_kwh': round(eur_kwh * 100, 2)
         })
 
     return result
 
 
+def dump_json_bytes(data):
+    """Serialiseer data als UTF-8 JSON met 2 spaties inspringing, identiek met of zonder orjson"""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+# Kolommen van de CSV-export per dag, in volgorde van het bestand
+CSV_FIELDS = ('datetime', 'hour', 'price_eur_mwh', 'price_eur_kwh', 'price_cent_kwh')
+
+
+def write_prices_csv(filename, prices):
+    """Schrijf geformatteerde prijsrijen naar CSV: kopregel met CSV_FIELDS, LF-regeleinden, floats via str()"""
+    with open(filename, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(CSV_FIELDS)
+        writer.writerows([p[field] for field in CSV_FIELDS] for p in prices)
+
+
 def save_combined_data(collected_data, primary_date):
     """Sla gecombineerde data op voor meerdere dagen"""
     if not collected_data:
@@ -610,29 +716,22 @@ def save_combined_data(collected_data, primary_date):
         'days': {key: info['data'] for key, info in collected_data.items()}
     }
 
-    with open('latest.json', 'w', encoding='utf-8') as f:
-        json.dump(combined_data, f, ensure_ascii=False, indent=2)
+    with open('latest.json', 'wb') as f:
+        f.write(dump_json_bytes(combined_data))
     print(f"💾 Combined data saved: latest.json ({len(collected_data)} dagen)")
 
     for day_key, day_info in collected_data.items():
         date_str = day_info['date'].replace('-', '')
 
         json_filename = f'day_ahead_prices_{date_str}.json'
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(day_info['data'], f, ensure_ascii=False, indent=2)
+        with open(json_filename, 'wb') as f:
+            f.write(dump_json_bytes(day_info['data']))
         print(f"💾 JSON saved: {json_filename}")
 
-        df_data = [{
-            'datetime': p['datetime'],
-            'hour': p['hour'],
-            'price_eur_mwh': p['price_eur_mwh'],
-            'price_eur_kwh': p['price_eur_kwh'],
-            'price_cent_kwh': p['price_cent_kwh']
-        } for p in day_info['data']['prices']]
-
-        if df_data:
+        prices = day_info['data']['prices']
+        if prices:
             csv_filename = f'day_ahead_prices_{date_str}.csv'
-            pd.DataFrame(df_data).to_csv(csv_filename, index=False)
+            write_prices_csv(csv_filename, prices)
             print(f"💾 CSV saved: {csv_filename}")
 
     return True
@@ -645,26 +744,21 @@ def save_data(data, target_date):
 
     date_str = target_date.astimezone(BRUSSELS_TZ).strftime('%Y%m%d')
 
+    # Hetzelfde document gaat naar het gedateerde bestand en latest.json, dus één keer encoderen
+    payload = dump_json_bytes(data)
+
     json_filename = f'day_ahead_prices_{date_str}.json'
-    with open(json_filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(json_filename, 'wb') as f:
+        f.write(payload)
     print(f"💾 JSON saved: {json_filename}")
 
-    df_data = [{
-        'datetime': p['datetime'],
-        'hour': p['hour'],
-        'price_eur_mwh': p['price_eur_mwh'],
-        'price_eur_kwh': p['price_eur_kwh'],
-        'price_cent_kwh': p['price_cent_kwh']
-    } for p in data['prices']]
-
-    if df_data:
+    if data['prices']:
         csv_filename = f'day_ahead_prices_{date_str}.csv'
-        pd.DataFrame(df_data).to_csv(csv_filename, index=False)
+        write_prices_csv(csv_filename, data['prices'])
         print(f"💾 CSV saved: {csv_filename}")
 
-    with open('latest.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open('latest.json', 'wb') as f:
+        f.write(payload)
     print(f"💾 Latest data saved: latest.json")
 
     return True
@@ -685,6 +779,8 @@ def main():
     print(f"🇧🇪 Huidige Belgische tijd: {now_belgian.strftime('%Y-%m-%d %H:%M:%S %Z')}")
 
     collected_data = {}
+    # Dagen die al (zonder resultaat) opgevraagd zijn, zodat de fallback ze niet opnieuw ophaalt
+    fetched_dates = {today.date(), tomorrow.date()}
 
     # Vandaag
     print(f"\n🎯 Ophalen data voor vandaag: {today.strftime('%Y-%m-%d %A')}")
@@ -704,6 +800,7 @@ def main():
         yesterday = today - timedelta(days=1)
         if yesterday.weekday() < 5:
             print(f"🔄 Proberen gisteren als fallback: {yesterday.strftime('%Y-%m-%d %A')}")
+            fetched_dates.add(yesterday.date())
             yesterday_data = fetch_day_ahead_prices(yesterday)
             if yesterday_data:
                 print(f"✅ Fallback data voor gisteren gevonden")
@@ -734,11 +831,6 @@ def main():
         if combined_success:
             print(f"\n✅ SUCCESS! Data opgeslagen voor {len(collected_data)} dag(en)")
 
-            def fmt_time(t):
-                if hasattr(t, 'strftime'):
-                    return t.strftime('%H:%M')
-                return datetime.fromisoformat(t.replace('Z', '+00:00')).strftime('%H:%M')
-
             for day_key, day_info in collected_data.items():
                 stats = day_info['data']['metadata']['statistics']
                 source = day_info['data']['metadata'].get('source', '?')
@@ -751,7 +843,7 @@ def main():
 
                 if best_3h:
                     print(f"💡 Beste 3u blok: "
-                          f"{fmt_time(best_3h['start_time'])}-{fmt_time(best_3h['end_time'])} "
+                          f"{format_time_hhmm(best_3h['start_time'])}-{format_time_hhmm(best_3h['end_time'])} "
                           f"(€{best_3h['average_price']:.2f}/MWh)")
             return
 
@@ -772,6 +864,10 @@ def main():
             print(f"⏭️ Skipping {date_label} - weekend")
             continue
 
+        if target_date.date() in fetched_dates:
+            print(f"⏭️ Skipping {date_label} - al geprobeerd")
+            continue
+
         print(f"\n🎯 Proberen {date_label}: {target_date.strftime('%Y-%m-%d %A')}")
         data = fetch_day_ahead_prices(target_date)
 